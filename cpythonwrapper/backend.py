@@ -0,0 +1,50 @@
+"""
+Backend selection for the demos and examples.
+
+Imports the C++ accelerated module once and binds each of its functions to a
+module-level name, falling back to the pure Python implementation when the
+extension has not been built. Callers import the bound names directly, so no
+cpp_accelerated attribute lookups happen at call time.
+
+The closed-form sum of squares is additionally exposed through ctypes from
+libcpp_accel.so (``make lib``) as ``sum_of_squares_optimized_c``. For an O(1)
+function the pybind11 argument conversion dominates the call, and a direct
+``c_int64`` binding skips it. The name is None when the library is missing.
+"""
+
+import ctypes
+import os
+
+try:
+    from cpp_accelerated import (
+        sum_of_squares as sum_of_squares_fast,
+        sum_of_squares_optimized as sum_of_squares_optimized_fast,
+        fibonacci_recursive as fibonacci_recursive_fast,
+        fibonacci_memoized as fibonacci_memoized_fast,
+        prime_count as prime_count_fast,
+        prime_count_optimized as prime_count_optimized_fast,
+        matrix_multiplication as matrix_multiplication_fast,
+    )
+    CPP_AVAILABLE = True
+    CPP_IMPORT_ERROR = None
+except ImportError as e:
+    from python_implementation import (
+        sum_of_squares as sum_of_squares_fast,
+        sum_of_squares as sum_of_squares_optimized_fast,
+        fibonacci_recursive as fibonacci_recursive_fast,
+        fibonacci_recursive as fibonacci_memoized_fast,
+        prime_count as prime_count_fast,
+        prime_count as prime_count_optimized_fast,
+        matrix_multiplication as matrix_multiplication_fast,
+    )
+    CPP_AVAILABLE = False
+    CPP_IMPORT_ERROR = str(e)
+
+
+try:
+    _lib = ctypes.CDLL(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'libcpp_accel.so'))
+    _lib.sum_of_squares_optimized_c.argtypes = [ctypes.c_int64]
+    _lib.sum_of_squares_optimized_c.restype = ctypes.c_int64
+    sum_of_squares_optimized_c = _lib.sum_of_squares_optimized_c
+except OSError:
+    sum_of_squares_optimized_c = None
\ No newline at end of file
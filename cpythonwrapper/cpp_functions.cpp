@@ -1,5 +1,8 @@
 #include <vector>
 #include <cmath>
+#include <cstdint>
+
+#include "cpp_functions.h"
 
 /**
  * C++ implementation of computationally intensive functions.
@@ -155,4 +158,47 @@ long long fibonacci_memoized(int n) {
     return memo[n];
 }
 
-} // namespace cpp_functions
\ No newline at end of file
+/**
+ * Matrix multiplication with the rows of the result split across threads.
+ * Same i-k-j loop and results as matrix_multiplication; each thread owns
+ * whole result rows, so no synchronization is needed. Runs serially when
+ * the extension is built without OpenMP.
+ */
+std::vector<std::vector<int>> matrix_multiplication_parallel(int size) {
+    std::vector<std::vector<int>> matrix_a(size, std::vector<int>(size));
+    std::vector<std::vector<int>> matrix_b(size, std::vector<int>(size));
+    
+    #pragma omp parallel for schedule(static)
+    for (int i = 0; i < size; ++i) {
+        for (int j = 0; j < size; ++j) {
+            matrix_a[i][j] = i + j;
+            matrix_b[i][j] = i * j + 1;
+        }
+    }
+    
+    std::vector<std::vector<int>> result(size, std::vector<int>(size, 0));
+    
+    #pragma omp parallel for schedule(static)
+    for (int i = 0; i < size; ++i) {
+        std::vector<int>& row = result[i];
+        for (int k = 0; k < size; ++k) {
+            const int a_ik = matrix_a[i][k];
+            const std::vector<int>& row_b = matrix_b[k];
+            for (int j = 0; j < size; ++j) {
+                row[j] += a_ik * row_b[j];
+            }
+        }
+    }
+    
+    return result;
+}
+
+} // namespace cpp_functions
+
+/**
+ * Plain C entry point for the closed-form sum of squares, so it can be bound
+ * directly with ctypes (see backend.py) without going through pybind11.
+ */
+extern "C" int64_t sum_of_squares_optimized_c(int64_t n) {
+    return (n * (n + 1) * (2 * n + 1)) / 6;
+}
\ No newline at end of file
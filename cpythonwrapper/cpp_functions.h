@@ -2,6 +2,7 @@
 #define CPP_FUNCTIONS_H
 
 #include <vector>
+#include <cstdint>
 
 /**
  * Header file for C++ implementation of computationally intensive functions.
@@ -45,6 +46,17 @@ int prime_count_optimized(int limit);
  */
 long long fibonacci_memoized(int n);
 
+/**
+ * Matrix multiplication parallelized over result rows with OpenMP.
+ */
+std::vector<std::vector<int>> matrix_multiplication_parallel(int size);
+
 } // namespace cpp_functions
 
+/**
+ * C ABI version of sum_of_squares_optimized for ctypes, built into
+ * libcpp_accel.so by `make lib`.
+ */
+extern "C" int64_t sum_of_squares_optimized_c(int64_t n);
+
 #endif // CPP_FUNCTIONS_H
\ No newline at end of file
@@ -4,21 +4,41 @@ Simple demonstration script showing how to use both Python and C++ implementatio
 This script provides an easy way to test individual functions and see the performance difference.
 """
 
-import time
+from time import perf_counter_ns as pcn
 import sys
+from functools import lru_cache
 
 # Import implementations
 import python_implementation
 
-try:
-    import cpp_accelerated
-    CPP_AVAILABLE = True
-except ImportError:
-    CPP_AVAILABLE = False
+from backend import (
+    CPP_AVAILABLE,
+    sum_of_squares_fast,
+    sum_of_squares_optimized_fast,
+    fibonacci_recursive_fast,
+    fibonacci_memoized_fast,
+    prime_count_fast,
+    prime_count_optimized_fast,
+    matrix_multiplication_fast,
+)
+
+if not CPP_AVAILABLE:
     print("Warning: C++ module not available. Only Python functions will work.")
     print("To build: python setup.py build_ext --inplace")
 
 
+@lru_cache(maxsize=32)
+def python_baseline(func, arg):
+    """
+    Run and time a Python implementation once per (function, argument).
+    Re-running a demo reuses the measured result and time, so the C++
+    variants can be compared again without waiting out the Python side.
+    """
+    start = pcn()
+    result = func(arg)
+    return result, pcn() - start
+
+
 def demo_sum_of_squares():
     """Demonstrate sum of squares calculation."""
     print("\n" + "="*50)
@@ -29,26 +49,24 @@ def demo_sum_of_squares():
     print(f"Calculating sum of squares from 1 to {n:,}")
     
     # Python version
-    start = time.perf_counter()
-    py_result = python_implementation.sum_of_squares(n)
-    py_time = time.perf_counter() - start
-    print(f"Python result: {py_result:,} (took {py_time:.6f}s)")
+    py_result, py_ns = python_baseline(python_implementation.sum_of_squares, n)
+    print(f"Python result: {py_result:,} (took {py_ns/1e9:.9f}s)")
     
     if CPP_AVAILABLE:
         # C++ version
-        start = time.perf_counter()
-        cpp_result = cpp_accelerated.sum_of_squares(n)
-        cpp_time = time.perf_counter() - start
-        print(f"C++ result:    {cpp_result:,} (took {cpp_time:.6f}s)")
+        start = pcn()
+        cpp_result = sum_of_squares_fast(n)
+        cpp_ns = pcn() - start
+        print(f"C++ result:    {cpp_result:,} (took {cpp_ns/1e9:.9f}s)")
         
         # Optimized C++ version
-        start = time.perf_counter()
-        opt_result = cpp_accelerated.sum_of_squares_optimized(n)
-        opt_time = time.perf_counter() - start
-        print(f"C++ optimized: {opt_result:,} (took {opt_time:.6f}s)")
+        start = pcn()
+        opt_result = sum_of_squares_optimized_fast(n)
+        opt_ns = pcn() - start
+        print(f"C++ optimized: {opt_result:,} (took {opt_ns/1e9:.9f}s)")
         
-        if py_time > 0:
-            speedup = py_time / cpp_time
+        if py_ns > 0:
+            speedup = py_ns / cpp_ns
             print(f"\nSpeedup: {speedup:.1f}x faster with C++")
 
 
@@ -62,27 +80,25 @@ def demo_fibonacci():
     print(f"Calculating Fibonacci number #{n}")
     
     # Python version
-    start = time.perf_counter()
-    py_result = python_implementation.fibonacci_recursive(n)
-    py_time = time.perf_counter() - start
-    print(f"Python result: {py_result:,} (took {py_time:.6f}s)")
+    py_result, py_ns = python_baseline(python_implementation.fibonacci_recursive, n)
+    print(f"Python result: {py_result:,} (took {py_ns/1e9:.9f}s)")
     
     if CPP_AVAILABLE:
         # C++ recursive version
-        start = time.perf_counter()
-        cpp_result = cpp_accelerated.fibonacci_recursive(n)
-        cpp_time = time.perf_counter() - start
-        print(f"C++ recursive: {cpp_result:,} (took {cpp_time:.6f}s)")
+        start = pcn()
+        cpp_result = fibonacci_recursive_fast(n)
+        cpp_ns = pcn() - start
+        print(f"C++ recursive: {cpp_result:,} (took {cpp_ns/1e9:.9f}s)")
         
         # C++ memoized version
-        start = time.perf_counter()
-        memo_result = cpp_accelerated.fibonacci_memoized(n)
-        memo_time = time.perf_counter() - start
-        print(f"C++ memoized:  {memo_result:,} (took {memo_time:.6f}s)")
+        start = pcn()
+        memo_result = fibonacci_memoized_fast(n)
+        memo_ns = pcn() - start
+        print(f"C++ memoized:  {memo_result:,} (took {memo_ns/1e9:.9f}s)")
         
-        if py_time > 0:
-            speedup1 = py_time / cpp_time
-            speedup2 = py_time / memo_time
+        if py_ns > 0:
+            speedup1 = py_ns / cpp_ns
+            speedup2 = py_ns / memo_ns
             print(f"\nSpeedup: {speedup1:.1f}x faster with C++ recursive")
             print(f"Speedup: {speedup2:.1f}x faster with C++ memoized")
 
@@ -97,27 +113,25 @@ def demo_prime_count():
     print(f"Counting prime numbers up to {limit:,}")
     
     # Python version
-    start = time.perf_counter()
-    py_result = python_implementation.prime_count(limit)
-    py_time = time.perf_counter() - start
-    print(f"Python result: {py_result:,} primes (took {py_time:.6f}s)")
+    py_result, py_ns = python_baseline(python_implementation.prime_count, limit)
+    print(f"Python result: {py_result:,} primes (took {py_ns/1e9:.9f}s)")
     
     if CPP_AVAILABLE:
         # C++ trial division version
-        start = time.perf_counter()
-        cpp_result = cpp_accelerated.prime_count(limit)
-        cpp_time = time.perf_counter() - start
-        print(f"C++ trial div: {cpp_result:,} primes (took {cpp_time:.6f}s)")
+        start = pcn()
+        cpp_result = prime_count_fast(limit)
+        cpp_ns = pcn() - start
+        print(f"C++ trial div: {cpp_result:,} primes (took {cpp_ns/1e9:.9f}s)")
         
         # C++ sieve version
-        start = time.perf_counter()
-        sieve_result = cpp_accelerated.prime_count_optimized(limit)
-        sieve_time = time.perf_counter() - start
-        print(f"C++ sieve:     {sieve_result:,} primes (took {sieve_time:.6f}s)")
+        start = pcn()
+        sieve_result = prime_count_optimized_fast(limit)
+        sieve_ns = pcn() - start
+        print(f"C++ sieve:     {sieve_result:,} primes (took {sieve_ns/1e9:.9f}s)")
         
-        if py_time > 0:
-            speedup1 = py_time / cpp_time
-            speedup2 = py_time / sieve_time
+        if py_ns > 0:
+            speedup1 = py_ns / cpp_ns
+            speedup2 = py_ns / sieve_ns
             print(f"\nSpeedup: {speedup1:.1f}x faster with C++ trial division")
             print(f"Speedup: {speedup2:.1f}x faster with C++ sieve")
 
@@ -132,23 +146,40 @@ def demo_matrix_mult():
     print(f"Multiplying two {size}x{size} matrices")
     
     # Python version
-    start = time.perf_counter()
-    py_result = python_implementation.matrix_multiplication(size)
-    py_time = time.perf_counter() - start
-    print(f"Python result: First element = {py_result[0][0]} (took {py_time:.6f}s)")
+    py_result, py_ns = python_baseline(python_implementation.matrix_multiplication, size)
+    print(f"Python result: First element = {py_result[0][0]} (took {py_ns/1e9:.9f}s)")
     
     if CPP_AVAILABLE:
         # C++ version
-        start = time.perf_counter()
-        cpp_result = cpp_accelerated.matrix_multiplication(size)
-        cpp_time = time.perf_counter() - start
-        print(f"C++ result:    First element = {cpp_result[0][0]} (took {cpp_time:.6f}s)")
+        start = pcn()
+        cpp_result = matrix_multiplication_fast(size)
+        cpp_ns = pcn() - start
+        print(f"C++ result:    First element = {cpp_result[0][0]} (took {cpp_ns/1e9:.9f}s)")
         
-        if py_time > 0:
-            speedup = py_time / cpp_time
+        if py_ns > 0:
+            speedup = py_ns / cpp_ns
             print(f"\nSpeedup: {speedup:.1f}x faster with C++")
 
 
+def demo_all():
+    """Run every demo in turn."""
+    demo_sum_of_squares()
+    demo_fibonacci()
+    demo_prime_count()
+    demo_matrix_mult()
+
+
+# Single dispatch table shared by the interactive menu (numeric choices) and
+# the command line (names), so the two entry points cannot drift apart.
+DEMOS = {
+    "1": demo_sum_of_squares, "sum": demo_sum_of_squares, "squares": demo_sum_of_squares,
+    "2": demo_fibonacci, "fib": demo_fibonacci, "fibonacci": demo_fibonacci,
+    "3": demo_prime_count, "prime": demo_prime_count, "primes": demo_prime_count,
+    "4": demo_matrix_mult, "matrix": demo_matrix_mult, "mult": demo_matrix_mult,
+    "5": demo_all, "all": demo_all, "demo": demo_all,
+}
+
+
 def interactive_demo():
     """Interactive demo allowing user to choose which functions to test."""
     print("Python + C++ Performance Comparison Demo")
@@ -173,19 +204,10 @@ def interactive_demo():
             if choice == "0":
                 print("Goodbye!")
                 break
-            elif choice == "1":
-                demo_sum_of_squares()
-            elif choice == "2":
-                demo_fibonacci()
-            elif choice == "3":
-                demo_prime_count()
-            elif choice == "4":
-                demo_matrix_mult()
-            elif choice == "5":
-                demo_sum_of_squares()
-                demo_fibonacci()
-                demo_prime_count()
-                demo_matrix_mult()
+            
+            demo = DEMOS.get(choice) if choice.isdigit() else None
+            if demo:
+                demo()
             else:
                 print("Invalid choice. Please select 0-5.")
         
@@ -198,22 +220,12 @@ def interactive_demo():
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
-        demo_name = sys.argv[1].lower()
-        if demo_name in ["sum", "squares"]:
-            demo_sum_of_squares()
-        elif demo_name in ["fib", "fibonacci"]:
-            demo_fibonacci()
-        elif demo_name in ["prime", "primes"]:
-            demo_prime_count()
-        elif demo_name in ["matrix", "mult"]:
-            demo_matrix_mult()
-        elif demo_name in ["all", "demo"]:
-            demo_sum_of_squares()
-            demo_fibonacci()
-            demo_prime_count()
-            demo_matrix_mult()
-        else:
-            print(f"Unknown demo: {demo_name}")
-            print("Available: sum, fibonacci, prime, matrix, all")
+        for demo_name in sys.argv[1:]:
+            demo = DEMOS.get(demo_name.lower())
+            if demo:
+                demo()
+            else:
+                print(f"Unknown demo: {demo_name.lower()}")
+                print("Available: sum, fibonacci, prime, matrix, all")
     else:
         interactive_demo()
\ No newline at end of file
@@ -6,21 +6,32 @@ This script demonstrates the basic usage of both Python and C++ implementations
 with simple, easy-to-understand examples.
 """
 
-import time
+from time import perf_counter_ns as pcn
+import timeit
 import sys
 import os
 
+import numpy as np
+
 # Add the parent directory to path to import our modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import python_implementation
 
-try:
-    import cpp_accelerated
-    CPP_AVAILABLE = True
+from backend import (
+    CPP_AVAILABLE,
+    sum_of_squares_fast,
+    sum_of_squares_optimized_fast,
+    fibonacci_recursive_fast,
+    fibonacci_memoized_fast,
+    prime_count_fast,
+    prime_count_optimized_fast,
+    matrix_multiplication_fast,
+)
+
+if CPP_AVAILABLE:
     print("✓ C++ accelerated module loaded successfully!")
-except ImportError:
-    CPP_AVAILABLE = False
+else:
     print("✗ C++ module not available. Please build it first:")
     print("  python setup.py build_ext --inplace")
 
@@ -31,25 +42,25 @@ def compare_performance(name, python_func, cpp_func, *args):
     print("-" * len(name))
     
     # Python version
-    start = time.perf_counter()
+    start = pcn()
     py_result = python_func(*args)
-    py_time = time.perf_counter() - start
-    print(f"Python: {py_result} (took {py_time:.6f}s)")
+    py_ns = pcn() - start
+    print(f"Python: {py_result} (took {py_ns/1e9:.9f}s)")
     
     if CPP_AVAILABLE and cpp_func:
         # C++ version
-        start = time.perf_counter()
+        start = pcn()
         cpp_result = cpp_func(*args)
-        cpp_time = time.perf_counter() - start
-        print(f"C++:    {cpp_result} (took {cpp_time:.6f}s)")
+        cpp_ns = pcn() - start
+        print(f"C++:    {cpp_result} (took {cpp_ns/1e9:.9f}s)")
         
         # Calculate speedup
-        if py_time > 0:
-            speedup = py_time / cpp_time
+        if py_ns > 0:
+            speedup = py_ns / cpp_ns
             print(f"Speedup: {speedup:.1f}x faster with C++")
         
         # Verify results match
-        if py_result == cpp_result:
+        if np.array_equal(py_result, cpp_result):
             print("✓ Results match!")
         else:
             print("✗ Results differ!")
@@ -66,7 +77,7 @@ def basic_examples():
     compare_performance(
         "Sum of squares (1 to 1000)",
         python_implementation.sum_of_squares,
-        cpp_accelerated.sum_of_squares if CPP_AVAILABLE else None,
+        sum_of_squares_fast,
         1000
     )
     
@@ -74,7 +85,7 @@ def basic_examples():
     compare_performance(
         "Fibonacci number #30",
         python_implementation.fibonacci_recursive,
-        cpp_accelerated.fibonacci_recursive if CPP_AVAILABLE else None,
+        fibonacci_recursive_fast,
         30
     )
     
@@ -82,7 +93,7 @@ def basic_examples():
     compare_performance(
         "Prime count up to 1000",
         python_implementation.prime_count,
-        cpp_accelerated.prime_count if CPP_AVAILABLE else None,
+        prime_count_fast,
         1000
     )
     
@@ -90,7 +101,7 @@ def basic_examples():
     compare_performance(
         "Matrix multiplication (50x50)",
         python_implementation.matrix_multiplication,
-        cpp_accelerated.matrix_multiplication if CPP_AVAILABLE else None,
+        matrix_multiplication_fast,
         50
     )
 
@@ -112,19 +123,19 @@ def optimized_examples():
     n = 100000
     
     # Standard implementation
-    start = time.perf_counter()
-    std_result = cpp_accelerated.sum_of_squares(n)
-    std_time = time.perf_counter() - start
-    print(f"Standard C++: {std_result} (took {std_time:.6f}s)")
+    start = pcn()
+    std_result = sum_of_squares_fast(n)
+    std_ns = pcn() - start
+    print(f"Standard C++: {std_result} (took {std_ns/1e9:.9f}s)")
     
     # Mathematical formula optimization
-    start = time.perf_counter()
-    opt_result = cpp_accelerated.sum_of_squares_optimized(n)
-    opt_time = time.perf_counter() - start
-    print(f"Optimized:    {opt_result} (took {opt_time:.6f}s)")
+    start = pcn()
+    opt_result = sum_of_squares_optimized_fast(n)
+    opt_ns = pcn() - start
+    print(f"Optimized:    {opt_result} (took {opt_ns/1e9:.9f}s)")
     
-    if std_time > 0:
-        speedup = std_time / opt_time
+    if std_ns > 0:
+        speedup = std_ns / opt_ns
         print(f"Optimization speedup: {speedup:.1f}x")
     
     # Prime counting optimization
@@ -134,19 +145,19 @@ def optimized_examples():
     limit = 50000
     
     # Trial division
-    start = time.perf_counter()
-    trial_result = cpp_accelerated.prime_count(limit)
-    trial_time = time.perf_counter() - start
-    print(f"Trial division: {trial_result} primes (took {trial_time:.6f}s)")
+    start = pcn()
+    trial_result = prime_count_fast(limit)
+    trial_ns = pcn() - start
+    print(f"Trial division: {trial_result} primes (took {trial_ns/1e9:.9f}s)")
     
     # Sieve of Eratosthenes
-    start = time.perf_counter()
-    sieve_result = cpp_accelerated.prime_count_optimized(limit)
-    sieve_time = time.perf_counter() - start
-    print(f"Sieve method:   {sieve_result} primes (took {sieve_time:.6f}s)")
+    start = pcn()
+    sieve_result = prime_count_optimized_fast(limit)
+    sieve_ns = pcn() - start
+    print(f"Sieve method:   {sieve_result} primes (took {sieve_ns/1e9:.9f}s)")
     
-    if trial_time > 0:
-        speedup = trial_time / sieve_time
+    if trial_ns > 0:
+        speedup = trial_ns / sieve_ns
         print(f"Algorithm speedup: {speedup:.1f}x")
     
     # Fibonacci memoization
@@ -156,19 +167,19 @@ def optimized_examples():
     n = 40
     
     # Recursive
-    start = time.perf_counter()
-    rec_result = cpp_accelerated.fibonacci_recursive(n)
-    rec_time = time.perf_counter() - start
-    print(f"Recursive: {rec_result} (took {rec_time:.6f}s)")
+    start = pcn()
+    rec_result = fibonacci_recursive_fast(n)
+    rec_ns = pcn() - start
+    print(f"Recursive: {rec_result} (took {rec_ns/1e9:.9f}s)")
     
     # Memoized
-    start = time.perf_counter()
-    memo_result = cpp_accelerated.fibonacci_memoized(n)
-    memo_time = time.perf_counter() - start
-    print(f"Memoized:  {memo_result} (took {memo_time:.6f}s)")
+    start = pcn()
+    memo_result = fibonacci_memoized_fast(n)
+    memo_ns = pcn() - start
+    print(f"Memoized:  {memo_result} (took {memo_ns/1e9:.9f}s)")
     
-    if rec_time > 0:
-        speedup = rec_time / memo_time
+    if rec_ns > 0:
+        speedup = rec_ns / memo_ns
         print(f"Memoization speedup: {speedup:.1f}x")
 
 
@@ -179,21 +190,20 @@ def custom_benchmark_example():
     print("=" * 50)
     
     def custom_benchmark(func, *args, iterations=5):
-        """Custom benchmark function."""
-        times = []
-        result = None
-        
+        """Custom benchmark function with autoranged batches per iteration."""
+        result = func(*args)
+        call = lambda: func(*args)
+        number, _ = timeit.Timer(call).autorange()
+        timer = timeit.Timer(call, timer=pcn)
+        times = np.empty(iterations, dtype=np.int64)
         for i in range(iterations):
-            start = time.perf_counter()
-            result = func(*args)
-            end = time.perf_counter()
-            times.append(end - start)
+            times[i] = timer.timeit(number) // number
         
-        avg_time = sum(times) / len(times)
-        min_time = min(times)
-        max_time = max(times)
+        avg_ns = times.mean()
+        min_ns = times.min()
+        max_ns = times.max()
         
-        return result, avg_time, min_time, max_time
+        return result, avg_ns, min_ns, max_ns
     
     print("\nCustom benchmark: Sum of squares (n=50000, 5 iterations)")
     
@@ -201,17 +211,17 @@ def custom_benchmark_example():
     py_result, py_avg, py_min, py_max = custom_benchmark(
         python_implementation.sum_of_squares, 50000
     )
-    print(f"Python: avg={py_avg:.6f}s, min={py_min:.6f}s, max={py_max:.6f}s")
+    print(f"Python: avg={py_avg/1e9:.9f}s, min={py_min/1e9:.9f}s, max={py_max/1e9:.9f}s")
     
     if CPP_AVAILABLE:
         # C++ benchmark
         cpp_result, cpp_avg, cpp_min, cpp_max = custom_benchmark(
-            cpp_accelerated.sum_of_squares, 50000
+            sum_of_squares_fast, 50000
         )
-        print(f"C++:    avg={cpp_avg:.6f}s, min={cpp_min:.6f}s, max={cpp_max:.6f}s")
+        print(f"C++:    avg={cpp_avg/1e9:.9f}s, min={cpp_min/1e9:.9f}s, max={cpp_max/1e9:.9f}s")
         
-        speedup = py_avg / cpp_avg
-        print(f"Average speedup: {speedup:.1f}x")
+        speedup = py_min / cpp_min
+        print(f"Best-case speedup: {speedup:.1f}x")
 
 
 if __name__ == "__main__":
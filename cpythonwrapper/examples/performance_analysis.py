@@ -6,12 +6,46 @@ This script generates detailed performance analysis reports comparing
 Python and C++ implementations across various scenarios and datasets.
 """
 
+import argparse
+import functools
 import time
 import sys
 import os
-import statistics
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# orjson serializes NumPy arrays natively; fall back to the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Growth of a scenario's Python cost from a probe size p to the real size n,
+# keyed by the complexity class declared in the scenario table
+COMPLEXITY_SCALING = {
+    'O(2^n)': lambda p, n: 2.0 ** (n - p),
+    'O(n)': lambda p, n: n / p,
+    # Trial division up to n tests sqrt(k) divisors for each k <= n
+    'O(n^1.5)': lambda p, n: (n / p) ** 1.5,
+    'O(n^2)': lambda p, n: (n / p) ** 2,
+    'O(n^3)': lambda p, n: (n / p) ** 3,
+}
+
+# Largest probe size per class: exponential probes get a fixed small n,
+# polynomial ones a tenth of the real size
+EXPONENTIAL_PROBE_N = 20
+POLYNOMIAL_PROBE_DIVISOR = 10
+
+# CPUs this process may run on, captured before the analyzer pins itself so
+# --parallel can still spread workers across all of them
+AVAILABLE_CPUS = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else []
+DEFAULT_PIN_CPU = AVAILABLE_CPUS[0] if AVAILABLE_CPUS else 0
+SCALING_GOVERNOR_PATH = "/sys/devices/system/cpu/cpu{}/cpufreq/scaling_governor"
 
 # Add the parent directory to path to import our modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -25,51 +59,150 @@ except ImportError:
     CPP_AVAILABLE = False
     print("Warning: C++ module not available. Analysis will be limited to Python only.")
 
+# C++ entry points resolved once; a symbol missing from an incomplete build
+# maps to None and is reported here rather than as an AttributeError mid-run
+CPP_FUNCTIONS = (
+    'sum_of_squares', 'sum_of_squares_optimized',
+    'fibonacci_recursive', 'fibonacci_memoized',
+    'prime_count', 'prime_count_optimized',
+    'matrix_multiplication',
+)
+CPP = {name: getattr(cpp_accelerated, name, None) if CPP_AVAILABLE else None
+       for name in CPP_FUNCTIONS}
+if CPP_AVAILABLE and None in CPP.values():
+    print("Warning: C++ module is missing: "
+          + ", ".join(name for name, func in CPP.items() if func is None))
+
+
+# Types whose repr always evaluates back to an equal value. float is left out:
+# repr(float('inf')) is 'inf', which is not a valid expression.
+_LITERAL_TYPES = (bool, int, str, type(None))
+
+
+def _specialize(func, args: Tuple):
+    """
+    Return a zero-argument caller equivalent to ``lambda: func(*args)``.
+    
+    Literal arguments are compiled into the caller's body, so the timing loop
+    pays for neither an argument tuple nor ``*args`` unpacking. Arguments of
+    any other type (floats included) fall back to functools.partial.
+    """
+    if not all(type(arg) in _LITERAL_TYPES for arg in args):
+        return functools.partial(func, *args)
+    source = f"def _caller(f):\n    def call():\n        return f({', '.join(map(repr, args))})\n    return call\n"
+    namespace = {}
+    exec(source, namespace)
+    return namespace['_caller'](func)
+
+
+def _json_default(obj):
+    """Encode NumPy values for the standard json module; anything else as str."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    return str(obj)
+
+
+def _read_cpuinfo_model() -> str:
+    """Return the CPU model name from /proc/cpuinfo, or '' where it is absent."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return ""
+
+
+@functools.lru_cache(maxsize=None)
+def _static_system_info() -> Dict[str, str]:
+    """
+    System facts that cannot change while the process runs, gathered once.
+    
+    os.uname() is a single syscall, where platform.platform() and
+    platform.processor() may spawn ``uname``; platform is only the fallback
+    for systems without os.uname (Windows).
+    """
+    architecture = '64bit' if sys.maxsize > 2**32 else '32bit'
+    python_version = sys.version.split()[0]
+    if hasattr(os, 'uname'):
+        uname = os.uname()
+        return {
+            'platform': f"{uname.sysname}-{uname.release}-{uname.machine}",
+            'processor': _read_cpuinfo_model() or uname.machine,
+            'python_version': python_version,
+            'architecture': architecture,
+            'system': uname.sysname,
+        }
+    import platform
+    return {
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'python_version': python_version,
+        'architecture': architecture,
+        'system': platform.system(),
+    }
+
 
 class PerformanceAnalyzer:
     """Comprehensive performance analysis tool."""
     
-    def __init__(self):
+    def __init__(self, pin_cpu: Optional[int] = None):
+        """
+        Create an analyzer, with its timing thread pinned to ``pin_cpu`` if given.
+        
+        Pinning keeps the scheduler from migrating the timing thread between
+        cores (or between P- and E-cores), which otherwise shows up as stdev.
+        Only the calling thread is pinned: Numba's worker threads, started when
+        python_implementation was imported, keep their original affinity, so
+        the parallel kernels still spread across CPUs.
+        """
         self.results = []
         self.system_info = self._get_system_info()
+        pinned = pin_cpu is not None and _pin_to_cpu(pin_cpu)
+        self.pin_cpu = pin_cpu if pinned else None
+        if not pinned:
+            self.system_info['cpu_affinity'] = "not pinned"
+        elif python_implementation.NUMBA_AVAILABLE:
+            self.system_info['cpu_affinity'] = (f"timing thread pinned to CPU {pin_cpu} "
+                                                "(Numba worker threads not pinned)")
+        else:
+            self.system_info['cpu_affinity'] = f"timing thread pinned to CPU {pin_cpu}"
+        self.system_info['cpu_governor'] = _read_scaling_governor(pin_cpu if pinned else DEFAULT_PIN_CPU)
     
     def _get_system_info(self) -> Dict[str, str]:
         """Gather system information for the report."""
-        import platform
-        return {
-            'platform': platform.platform(),
-            'processor': platform.processor(),
-            'python_version': platform.python_version(),
-            'architecture': platform.architecture()[0],
-            'system': platform.system(),
-            'cpp_available': CPP_AVAILABLE
-        }
+        info = dict(_static_system_info())
+        info['cpp_available'] = CPP_AVAILABLE
+        return info
     
     def benchmark_function(self, name: str, func, args: Tuple, iterations: int = 5) -> Dict[str, Any]:
         """Benchmark a single function with statistical analysis."""
-        times = []
+        # Raw samples stay integer nanoseconds; only the summary is in seconds
+        times = np.empty(iterations, dtype=np.int64)
         result = None
+        call = _specialize(func, args)
         
         # Warm-up run
-        result = func(*args)
+        result = call()
         
         # Actual benchmarking
-        for _ in range(iterations):
-            start = time.perf_counter()
-            result = func(*args)
-            end = time.perf_counter()
-            times.append(end - start)
+        for i in range(iterations):
+            start = time.perf_counter_ns()
+            result = call()
+            end = time.perf_counter_ns()
+            times[i] = end - start
         
         # Statistical analysis
         return {
             'name': name,
             'result': result,
             'times': times,
-            'mean': statistics.mean(times),
-            'median': statistics.median(times),
-            'stdev': statistics.stdev(times) if len(times) > 1 else 0,
-            'min': min(times),
-            'max': max(times),
+            'mean': float(times.mean()) / 1e9,
+            'median': float(np.median(times)) / 1e9,
+            'stdev': float(times.std(ddof=1)) / 1e9 if iterations > 1 else 0,
+            'min': int(times.min()) / 1e9,
+            'max': int(times.max()) / 1e9,
             'iterations': iterations
         }
     
@@ -102,104 +235,139 @@ class PerformanceAnalyzer:
                 comparison['improvement_percent'] = improvement
             
             # Verify correctness
-            comparison['results_match'] = (py_results['result'] == cpp_results['result'])
+            comparison['results_match'] = bool(np.array_equal(py_results['result'], cpp_results['result']))
         
         self.results.append(comparison)
         return comparison
     
-    def run_comprehensive_analysis(self):
-        """Run a comprehensive performance analysis across various scenarios."""
+    def run_comprehensive_analysis(self, parallel: bool = False, budget_s: Optional[float] = None):
+        """
+        Run a comprehensive performance analysis across various scenarios.
+        
+        With ``parallel`` the scenarios run in a process pool; if this
+        analyzer is pinned, each worker is pinned to its own CPU where the
+        platform allows it. Concurrent load skews
+        absolute timings, so use it for smoke runs and cross-checks only.
+        
+        With ``budget_s`` each scenario's Python cost is projected from a
+        small probe run and its complexity class; scenarios projected to take
+        longer than the budget are recorded as skipped instead of run.
+        """
         print("Running Comprehensive Performance Analysis")
         print("=" * 60)
         
-        # Test scenarios with different complexity levels
+        # Test scenarios with different complexity levels, as
+        # (task, python_implementation attribute, cpp_accelerated attribute,
+        #  args, complexity class) so they can be handed to worker processes
+        # by name and skipped when their projected cost exceeds the budget
         scenarios = [
             # Sum of squares with increasing complexity
-            ("Sum of Squares (n=1K)", python_implementation.sum_of_squares, 
-             cpp_accelerated.sum_of_squares if CPP_AVAILABLE else None, (1000,)),
-            ("Sum of Squares (n=10K)", python_implementation.sum_of_squares, 
-             cpp_accelerated.sum_of_squares if CPP_AVAILABLE else None, (10000,)),
-            ("Sum of Squares (n=100K)", python_implementation.sum_of_squares, 
-             cpp_accelerated.sum_of_squares if CPP_AVAILABLE else None, (100000,)),
-            ("Sum of Squares (n=1M)", python_implementation.sum_of_squares, 
-             cpp_accelerated.sum_of_squares if CPP_AVAILABLE else None, (1000000,)),
+            ("Sum of Squares (n=1K)", 'sum_of_squares', 'sum_of_squares', (1000,), 'O(n)'),
+            ("Sum of Squares (n=10K)", 'sum_of_squares', 'sum_of_squares', (10000,), 'O(n)'),
+            ("Sum of Squares (n=100K)", 'sum_of_squares', 'sum_of_squares', (100000,), 'O(n)'),
+            ("Sum of Squares (n=1M)", 'sum_of_squares', 'sum_of_squares', (1000000,), 'O(n)'),
             
             # Fibonacci with increasing complexity
-            ("Fibonacci (n=25)", python_implementation.fibonacci_recursive, 
-             cpp_accelerated.fibonacci_recursive if CPP_AVAILABLE else None, (25,)),
-            ("Fibonacci (n=30)", python_implementation.fibonacci_recursive, 
-             cpp_accelerated.fibonacci_recursive if CPP_AVAILABLE else None, (30,)),
-            ("Fibonacci (n=35)", python_implementation.fibonacci_recursive, 
-             cpp_accelerated.fibonacci_recursive if CPP_AVAILABLE else None, (35,)),
+            ("Fibonacci (n=25)", 'fibonacci_recursive', 'fibonacci_recursive', (25,), 'O(2^n)'),
+            ("Fibonacci (n=30)", 'fibonacci_recursive', 'fibonacci_recursive', (30,), 'O(2^n)'),
+            ("Fibonacci (n=35)", 'fibonacci_recursive', 'fibonacci_recursive', (35,), 'O(2^n)'),
             
             # Prime counting with different ranges
-            ("Prime Count (n=1K)", python_implementation.prime_count, 
-             cpp_accelerated.prime_count if CPP_AVAILABLE else None, (1000,)),
-            ("Prime Count (n=10K)", python_implementation.prime_count, 
-             cpp_accelerated.prime_count if CPP_AVAILABLE else None, (10000,)),
-            ("Prime Count (n=50K)", python_implementation.prime_count, 
-             cpp_accelerated.prime_count if CPP_AVAILABLE else None, (50000,)),
+            ("Prime Count (n=1K)", 'prime_count', 'prime_count', (1000,), 'O(n^1.5)'),
+            ("Prime Count (n=10K)", 'prime_count', 'prime_count', (10000,), 'O(n^1.5)'),
+            ("Prime Count (n=50K)", 'prime_count', 'prime_count', (50000,), 'O(n^1.5)'),
             
             # Matrix multiplication with different sizes
-            ("Matrix Mult (50x50)", python_implementation.matrix_multiplication, 
-             cpp_accelerated.matrix_multiplication if CPP_AVAILABLE else None, (50,)),
-            ("Matrix Mult (100x100)", python_implementation.matrix_multiplication, 
-             cpp_accelerated.matrix_multiplication if CPP_AVAILABLE else None, (100,)),
-            ("Matrix Mult (200x200)", python_implementation.matrix_multiplication, 
-             cpp_accelerated.matrix_multiplication if CPP_AVAILABLE else None, (200,)),
+            ("Matrix Mult (50x50)", 'matrix_multiplication', 'matrix_multiplication', (50,), 'O(n^3)'),
+            ("Matrix Mult (100x100)", 'matrix_multiplication', 'matrix_multiplication', (100,), 'O(n^3)'),
+            ("Matrix Mult (200x200)", 'matrix_multiplication', 'matrix_multiplication', (200,), 'O(n^3)'),
         ]
         
-        # Run all scenarios
-        for scenario in scenarios:
-            task_name, py_func, cpp_func, args = scenario
-            self.compare_implementations(task_name, py_func, cpp_func, args)
+        if budget_s is not None:
+            scenarios = list(self._within_budget(scenarios, budget_s))
+        
+        if parallel:
+            print("Note: --parallel runs scenarios concurrently; absolute timings are")
+            print("      not comparable to a sequential run (smoke tests only).")
+            cpus = AVAILABLE_CPUS if self.pin_cpu is not None else []
+            tasks = [(index, cpus, scenario) for index, scenario in enumerate(scenarios)]
+            # spawn, not fork: forking after Numba's parallel kernels have started
+            # their thread pool can deadlock the children
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context) as executor:
+                self.results.extend(executor.map(_run_scenario, tasks))
+        else:
+            for task_name, py_name, cpp_name, args, _ in scenarios:
+                py_func, cpp_func = _resolve_scenario(py_name, cpp_name)
+                self.compare_implementations(task_name, py_func, cpp_func, args)
         
         # Run optimized algorithm comparisons if C++ is available
         if CPP_AVAILABLE:
             self._analyze_optimized_algorithms()
     
+    def _within_budget(self, scenarios, budget_s: float):
+        """Yield the scenarios projected to fit ``budget_s``; record the rest as skipped."""
+        for scenario in scenarios:
+            task_name, py_name, _, args, complexity = scenario
+            projected = _project_python_seconds(getattr(python_implementation, py_name), args, complexity)
+            if projected <= budget_s:
+                yield scenario
+                continue
+            print(f"Skipping: {task_name} (projected {projected:.3g}s > budget {budget_s:g}s)")
+            self.results.append({
+                'task': task_name,
+                'args': args,
+                'python': None,
+                'cpp': None,
+                'speedup': None,
+                'improvement_percent': None,
+                'skipped': f"projected {projected:.3g}s exceeds {budget_s:g}s budget",
+            })
+    
     def _analyze_optimized_algorithms(self):
         """Analyze optimized C++ algorithms against standard implementations."""
         print("\nAnalyzing Optimized Algorithms...")
         
-        # Sum of squares: standard vs optimized
-        n = 1000000
-        std_results = self.benchmark_function("Sum Squares Standard", cpp_accelerated.sum_of_squares, (n,))
-        opt_results = self.benchmark_function("Sum Squares Optimized", cpp_accelerated.sum_of_squares_optimized, (n,))
+        self.optimization_results = []
         
-        optimization_comparison = {
-            'task': 'Sum of Squares Optimization',
-            'standard': std_results,
-            'optimized': opt_results,
-            'speedup': std_results['mean'] / opt_results['mean'] if opt_results['mean'] > 0 else None
-        }
+        # Sum of squares: standard vs optimized
+        if CPP['sum_of_squares'] and CPP['sum_of_squares_optimized']:
+            n = 1000000
+            std_results = self.benchmark_function("Sum Squares Standard", CPP['sum_of_squares'], (n,))
+            opt_results = self.benchmark_function("Sum Squares Optimized", CPP['sum_of_squares_optimized'], (n,))
+            
+            self.optimization_results.append({
+                'task': 'Sum of Squares Optimization',
+                'standard': std_results,
+                'optimized': opt_results,
+                'speedup': std_results['mean'] / opt_results['mean'] if opt_results['mean'] > 0 else None
+            })
         
         # Prime counting: trial division vs sieve
-        limit = 100000
-        trial_results = self.benchmark_function("Prime Count Trial", cpp_accelerated.prime_count, (limit,))
-        sieve_results = self.benchmark_function("Prime Count Sieve", cpp_accelerated.prime_count_optimized, (limit,))
-        
-        algorithm_comparison = {
-            'task': 'Prime Count Algorithm Comparison',
-            'trial_division': trial_results,
-            'sieve': sieve_results,
-            'speedup': trial_results['mean'] / sieve_results['mean'] if sieve_results['mean'] > 0 else None
-        }
+        if CPP['prime_count'] and CPP['prime_count_optimized']:
+            limit = 100000
+            trial_results = self.benchmark_function("Prime Count Trial", CPP['prime_count'], (limit,))
+            sieve_results = self.benchmark_function("Prime Count Sieve", CPP['prime_count_optimized'], (limit,))
+            
+            self.optimization_results.append({
+                'task': 'Prime Count Algorithm Comparison',
+                'trial_division': trial_results,
+                'sieve': sieve_results,
+                'speedup': trial_results['mean'] / sieve_results['mean'] if sieve_results['mean'] > 0 else None
+            })
         
         # Fibonacci: recursive vs memoized
-        n = 40
-        rec_results = self.benchmark_function("Fibonacci Recursive", cpp_accelerated.fibonacci_recursive, (n,), iterations=1)
-        memo_results = self.benchmark_function("Fibonacci Memoized", cpp_accelerated.fibonacci_memoized, (n,))
-        
-        memoization_comparison = {
-            'task': 'Fibonacci Memoization',
-            'recursive': rec_results,
-            'memoized': memo_results,
-            'speedup': rec_results['mean'] / memo_results['mean'] if memo_results['mean'] > 0 else None
-        }
-        
-        # Store optimization results
-        self.optimization_results = [optimization_comparison, algorithm_comparison, memoization_comparison]
+        if CPP['fibonacci_recursive'] and CPP['fibonacci_memoized']:
+            n = 40
+            rec_results = self.benchmark_function("Fibonacci Recursive", CPP['fibonacci_recursive'], (n,), iterations=1)
+            memo_results = self.benchmark_function("Fibonacci Memoized", CPP['fibonacci_memoized'], (n,))
+            
+            self.optimization_results.append({
+                'task': 'Fibonacci Memoization',
+                'recursive': rec_results,
+                'memoized': memo_results,
+                'speedup': rec_results['mean'] / memo_results['mean'] if memo_results['mean'] > 0 else None
+            })
     
     def generate_text_report(self) -> str:
         """Generate a comprehensive text report."""
@@ -215,6 +383,10 @@ class PerformanceAnalyzer:
         report.append(f"  Python Version: {self.system_info['python_version']}")
         report.append(f"  Architecture: {self.system_info['architecture']}")
         report.append(f"  C++ Module Available: {self.system_info['cpp_available']}")
+        report.append(f"  CPU Affinity: {self.system_info['cpu_affinity']}")
+        report.append(f"  CPU Governor: {self.system_info['cpu_governor']}")
+        if self.system_info['cpu_governor'] not in ('performance', 'unknown'):
+            report.append("    (for steadier timings: cpupower frequency-set -g performance)")
         report.append("")
         
         # Performance comparison results
@@ -239,21 +411,29 @@ class PerformanceAnalyzer:
             report.append("-" * 45)
             
             for result in self.results:
-                py_time = result['python']['mean'] * 1000
-                report.append(f"{result['task']:<30} {py_time:<12.3f}")
+                if result['python']:
+                    py_time = result['python']['mean'] * 1000
+                    report.append(f"{result['task']:<30} {py_time:<12.3f}")
         
         report.append("")
         
+        skipped = [r for r in self.results if r.get('skipped')]
+        if skipped:
+            report.append("Skipped (over time budget):")
+            for result in skipped:
+                report.append(f"  {result['task']}: {result['skipped']}")
+            report.append("")
+        
         # Statistical summary
         if CPP_AVAILABLE and any(r['speedup'] for r in self.results if r['speedup']):
-            speedups = [r['speedup'] for r in self.results if r['speedup']]
+            speedups = np.array([r['speedup'] for r in self.results if r['speedup']])
             report.append("Statistical Summary:")
-            report.append(f"  Average Speedup: {statistics.mean(speedups):.2f}x")
-            report.append(f"  Median Speedup: {statistics.median(speedups):.2f}x")
-            report.append(f"  Max Speedup: {max(speedups):.2f}x")
-            report.append(f"  Min Speedup: {min(speedups):.2f}x")
+            report.append(f"  Average Speedup: {speedups.mean():.2f}x")
+            report.append(f"  Median Speedup: {np.median(speedups):.2f}x")
+            report.append(f"  Max Speedup: {speedups.max():.2f}x")
+            report.append(f"  Min Speedup: {speedups.min():.2f}x")
             if len(speedups) > 1:
-                report.append(f"  Speedup Std Dev: {statistics.stdev(speedups):.2f}")
+                report.append(f"  Speedup Std Dev: {speedups.std(ddof=1):.2f}")
             report.append("")
         
         # Optimization results
@@ -272,7 +452,7 @@ class PerformanceAnalyzer:
         report.append("-" * 15)
         
         if CPP_AVAILABLE:
-            avg_speedup = statistics.mean([r['speedup'] for r in self.results if r['speedup']])
+            avg_speedup = np.mean([r['speedup'] for r in self.results if r['speedup']])
             if avg_speedup > 10:
                 report.append("  • Excellent performance gains with C++ acceleration")
                 report.append("  • Recommended for production use in compute-intensive applications")
@@ -300,18 +480,94 @@ class PerformanceAnalyzer:
             'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, default=str,
+                                     option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2, default=_json_default)
         
         print(f"Detailed results saved to {filename}")
 
 
+def _project_python_seconds(func, args: Tuple, complexity: str, iterations: int = 5) -> float:
+    """
+    Project the time compare_implementations would spend in ``func(*args)``.
+    
+    Times one call at a reduced size and scales it by the scenario's
+    complexity class, counting the warm-up plus ``iterations`` timed runs.
+    """
+    n = args[0]
+    if complexity == 'O(2^n)':
+        probe_n = min(n, EXPONENTIAL_PROBE_N)
+    else:
+        probe_n = max(1, n // POLYNOMIAL_PROBE_DIVISOR)
+    start = time.perf_counter()
+    func(probe_n, *args[1:])
+    probe_seconds = time.perf_counter() - start
+    return probe_seconds * COMPLEXITY_SCALING[complexity](probe_n, n) * (iterations + 1)
+
+
+def _pin_to_cpu(cpu: int) -> bool:
+    """
+    Restrict the calling thread (the whole process on Windows) to one CPU;
+    return whether the platform allowed it. Threads that already exist, such
+    as Numba's worker pool, are not moved.
+    """
+    try:
+        if hasattr(os, 'sched_setaffinity'):
+            os.sched_setaffinity(0, {cpu})
+            return True
+        if sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            return bool(kernel32.SetProcessAffinityMask(kernel32.GetCurrentProcess(), 1 << cpu))
+    except OSError:
+        pass
+    return False
+
+
+def _read_scaling_governor(cpu: int) -> str:
+    """Return the cpufreq governor for ``cpu``, or 'unknown' where it is not exposed."""
+    try:
+        with open(SCALING_GOVERNOR_PATH.format(cpu)) as f:
+            return f.read().strip()
+    except OSError:
+        return "unknown"
+
+
+def _resolve_scenario(py_name: str, cpp_name: str):
+    """Look up a scenario's Python and C++ functions by attribute name."""
+    py_func = getattr(python_implementation, py_name)
+    cpp_func = CPP[cpp_name]
+    return py_func, cpp_func
+
+
+def _run_scenario(task) -> Dict[str, Any]:
+    """Worker for --parallel: pin to a CPU if one is given, then compare one scenario."""
+    index, cpus, (task_name, py_name, cpp_name, args, _) = task
+    py_func, cpp_func = _resolve_scenario(py_name, cpp_name)
+    analyzer = PerformanceAnalyzer(pin_cpu=cpus[index % len(cpus)] if cpus else None)
+    return analyzer.compare_implementations(task_name, py_func, cpp_func, args)
+
+
 def main():
     """Main analysis function."""
-    analyzer = PerformanceAnalyzer()
+    parser = argparse.ArgumentParser(description="Python vs C++ performance analysis")
+    parser.add_argument("--parallel", action="store_true",
+                        help="run scenarios in a process pool (smoke runs only)")
+    parser.add_argument("--budget-s", type=float, default=30.0,
+                        help="skip scenarios whose projected Python time exceeds this many seconds")
+    parser.add_argument("--pin", action="store_true",
+                        help=f"pin the timing thread to CPU {DEFAULT_PIN_CPU} "
+                             "(Numba worker threads are not pinned)")
+    options = parser.parse_args()
+    
+    analyzer = PerformanceAnalyzer(pin_cpu=DEFAULT_PIN_CPU if options.pin else None)
     
     # Run comprehensive analysis
-    analyzer.run_comprehensive_analysis()
+    analyzer.run_comprehensive_analysis(parallel=options.parallel, budget_s=options.budget_s)
     
     # Generate and display report
     print("\n" + "=" * 60)
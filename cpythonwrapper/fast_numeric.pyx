@@ -0,0 +1,60 @@
+"""
+Cython mirror of the hot integer functions in python_implementation.py.
+The loops are typed as C long long, so the accumulators never become
+Python objects. Built by setup.py when Cython is installed.
+"""
+
+
+def sum_of_squares(long long n):
+    """
+    Calculate the sum of squares from 1 to n by iterating over every term.
+    
+    Args:
+        n (int): Upper limit for the sum calculation
+        
+    Returns:
+        int: Sum of squares from 1 to n
+    """
+    cdef long long total = 0
+    cdef long long i
+    for i in range(1, n + 1):
+        total += i * i
+    return total
+
+
+cdef bint _is_wheel_prime(long long num) nogil:
+    """Trial division of num >= 5 of the form 6k +/- 1 by divisors of that form."""
+    cdef long long divisor = 5
+    cdef long long step = 2
+    while divisor * divisor <= num:
+        if num % divisor == 0:
+            return False
+        divisor += step
+        step = 6 - step
+    return True
+
+
+def prime_count(long long limit):
+    """
+    Count the number of prime numbers up to the given limit.
+    Uses trial division on a 6k +/- 1 wheel, like python_implementation.
+    
+    Args:
+        limit (int): Upper limit for prime counting
+        
+    Returns:
+        int: Number of prime numbers up to limit
+    """
+    if limit < 2:
+        return 0
+    
+    cdef long long count = 1 if limit < 3 else 2  # 2 and 3
+    cdef long long num = 5
+    cdef long long gap = 2
+    with nogil:
+        while num <= limit:
+            if _is_wheel_prime(num):
+                count += 1
+            num += gap
+            gap = 6 - gap
+    return count
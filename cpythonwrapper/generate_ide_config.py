@@ -5,28 +5,36 @@ This script creates a compile commands database that helps IDEs and language ser
 understand how to compile the C++ files with the correct include paths.
 """
 
+import functools
 import json
 import sys
 import os
 import subprocess
 from pathlib import Path
 
+# Both paths come from a single child interpreter; pybind11 is optional there
+# so the Python include path survives a missing pybind11.
+_INCLUDE_QUERY = """
+import sysconfig
+print(sysconfig.get_path("include"))
+try:
+    import pybind11
+    print(pybind11.get_include())
+except ImportError:
+    print()
+"""
+
+
+@functools.lru_cache(maxsize=None)
 def get_python_info():
-    """Get Python and pybind11 include paths."""
+    """Get Python and pybind11 include paths (cached for the process)."""
     try:
-        # Get Python include path
-        python_include = subprocess.check_output([
-            sys.executable, '-c', 
-            'import sysconfig; print(sysconfig.get_path("include"))'
-        ]).decode().strip()
+        output = subprocess.check_output([sys.executable, '-c', _INCLUDE_QUERY]).decode()
+        python_include, pybind11_include = (output.splitlines() + ["", ""])[:2]
+        python_include = python_include.strip()
+        pybind11_include = pybind11_include.strip()
         
-        # Get pybind11 include path
-        try:
-            pybind11_include = subprocess.check_output([
-                sys.executable, '-c',
-                'import pybind11; print(pybind11.get_include())'
-            ]).decode().strip()
-        except:
+        if not pybind11_include:
             # Fallback for virtual environment
             import site
             site_packages = site.getsitepackages()[0] if site.getsitepackages() else ""
@@ -89,11 +97,21 @@ def generate_compile_commands():
         }
         compile_commands.append(command)
     
-    # Write to file
-    with open("compile_commands.json", "w") as f:
-        json.dump(compile_commands, f, indent=2)
+    # Write to file, unless it already holds exactly this content: rewriting
+    # an unchanged database still makes clangd re-index the project
+    content = json.dumps(compile_commands, indent=2)
+    try:
+        with open("compile_commands.json") as f:
+            unchanged = f.read() == content
+    except OSError:
+        unchanged = False
     
-    print("✓ Generated compile_commands.json")
+    if unchanged:
+        print("✓ compile_commands.json is up to date")
+    else:
+        with open("compile_commands.json", "w") as f:
+            f.write(content)
+        print("✓ Generated compile_commands.json")
     print(f"  Python include: {python_include}")
     print(f"  pybind11 include: {pybind11_include}")
     return True
@@ -9,19 +9,70 @@ and C++ accelerated versions of the same algorithms.
 Usage:
     python performance_benchmark.py
 
+    To count hardware events only inside the timed loops, start perf with
+    its counters disabled and hand it a control FIFO pair:
+
+    mkfifo ctl ack
+    exec {PERF_CTL_FD}<>ctl {PERF_CTL_ACK_FD}<>ack
+    export PERF_CTL_FD PERF_CTL_ACK_FD
+    perf stat --delay=-1 --control fd:${PERF_CTL_FD},${PERF_CTL_ACK_FD} \
+        -e cycles,instructions -- python performance_benchmark.py
+
 Requirements:
     - Built C++ extension module (cpp_accelerated)
     - Python modules: time, sys, importlib
 """
 
+import os
 import sys
 import time
 import importlib.util
-from typing import Tuple, Any, Callable
+from typing import Tuple, Any, Callable, Optional
+
+import numpy as np
 
 # Import pure Python implementations
 import python_implementation
 
+# Numba is optional; it is only needed to compile JIT kernels ahead of timing
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Warmup runs repeat until two consecutive runs agree within this tolerance
+WARMUP_TOLERANCE = 0.05
+WARMUP_MAX_RUNS = 20
+
+# Each timed batch repeats the call until it lasts at least this long, so the
+# clock is read once per batch rather than once per (possibly sub-us) call
+MIN_BATCH_TIME = 0.01
+
+
+def _env_fd(name: str) -> Optional[int]:
+    """Return the file descriptor number in environment variable ``name``, if any."""
+    value = os.environ.get(name, "")
+    return int(value) if value.isdigit() else None
+
+
+# perf's control and acknowledgement FIFOs (perf stat/record --control fd:...)
+PERF_CTL_FD = _env_fd("PERF_CTL_FD")
+PERF_CTL_ACK_FD = _env_fd("PERF_CTL_ACK_FD")
+
+
+def perf_control(command: str) -> None:
+    """
+    Send ``command`` ("enable" or "disable") to perf's control FIFO when
+    running under ``perf --control``, and wait for perf to acknowledge it.
+    A no-op otherwise.
+    """
+    if PERF_CTL_FD is None:
+        return
+    os.write(PERF_CTL_FD, f"{command}\n".encode())
+    if PERF_CTL_ACK_FD is not None:
+        os.read(PERF_CTL_ACK_FD, 5)
+
+
 # Try to import C++ accelerated module
 try:
     import cpp_accelerated
@@ -37,6 +88,12 @@ def benchmark_function(func: Callable, *args, iterations: int = 1, name: str = "
     """
     Benchmark a function by running it multiple times and measuring execution time.
     
+    Numba dispatchers are compiled for the argument types first, and the
+    function is warmed up until two consecutive runs are within
+    WARMUP_TOLERANCE of each other (at most WARMUP_MAX_RUNS runs). Each of
+    the ``iterations`` measurements then times a batch of calls sized to
+    last at least MIN_BATCH_TIME, and reports the per-call average.
+    
     Args:
         func: Function to benchmark
         *args: Arguments to pass to the function
@@ -48,21 +105,59 @@ def benchmark_function(func: Callable, *args, iterations: int = 1, name: str = "
     """
     print(f"  Running {name}..." if name else "  Running...", end=" ", flush=True)
     
-    start_time = time.perf_counter()
-    result = None
+    # pybind11 converts a Python int directly but sends a NumPy integer
+    # through __index__, which costs several times the call itself for the
+    # fast C++ kernels; hand it plain ints
+    args = tuple(int(arg) if isinstance(arg, np.integer) else arg for arg in args)
+    
+    # Compile Numba kernels for these argument types before anything is timed
+    if numba is not None and hasattr(func, 'signatures'):
+        signature = tuple(numba.typeof(arg) for arg in args)
+        if signature not in func.signatures:
+            func.compile(signature)
+    
+    # Warm up until successive runs stabilize, so caches, lazy loading and
+    # any remaining JIT work stay out of the measurement
+    previous = None
+    for _ in range(WARMUP_MAX_RUNS):
+        warmup_start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - warmup_start
+        if previous is not None and abs(elapsed - previous) <= WARMUP_TOLERANCE * elapsed:
+            break
+        previous = elapsed
+    
+    # Double the batch size until one batch lasts at least MIN_BATCH_TIME
+    inner = 1
+    while True:
+        batch_start = time.perf_counter()
+        for _ in range(inner):
+            func(*args)
+        if time.perf_counter() - batch_start >= MIN_BATCH_TIME:
+            break
+        inner *= 2
     
+    result = None
+    times = []
+    # Only the timed batches are counted by an attached perf
+    perf_control("enable")
     for _ in range(iterations):
-        result = func(*args)
+        start_time = time.perf_counter()
+        for _ in range(inner):
+            result = func(*args)
+        end_time = time.perf_counter()
+        times.append((end_time - start_time) / inner)
+    perf_control("disable")
     
-    end_time = time.perf_counter()
-    average_time = (end_time - start_time) / iterations
+    average_time = sum(times) / iterations
     
     print(f"Done ({average_time:.6f}s)")
     return result, average_time
 
 
 def compare_implementations(test_name: str, python_func: Callable, cpp_func: Callable, 
-                          args: tuple, iterations: int = 1) -> None:
+                          args: tuple, iterations: int = 1,
+                          numba_func: Optional[Callable] = None) -> None:
     """
     Compare Python and C++ implementations of the same function.
     
@@ -72,6 +167,8 @@ def compare_implementations(test_name: str, python_func: Callable, cpp_func: Cal
         cpp_func: C++ function to test (or None if not available)
         args: Arguments to pass to both functions
         iterations: Number of iterations for benchmarking
+        numba_func: Numba-compiled Python variant to report as a third
+            column (ignored when Numba is not installed)
     """
     print(f"\n{test_name}")
     print("=" * len(test_name))
@@ -80,13 +177,21 @@ def compare_implementations(test_name: str, python_func: Callable, cpp_func: Cal
     print("Python Implementation:")
     py_result, py_time = benchmark_function(python_func, *args, iterations=iterations, name="Python")
     
+    # Benchmark the Numba-compiled variant of the same loop
+    nb_time = None
+    if python_implementation.NUMBA_AVAILABLE and numba_func is not None:
+        print("Python+Numba Implementation:")
+        nb_result, nb_time = benchmark_function(numba_func, *args, iterations=iterations, name="Python+Numba")
+        if not np.array_equal(py_result, nb_result):
+            print(f"✗ Results differ! Python: {py_result}, Python+Numba: {nb_result}")
+    
     if CPP_AVAILABLE and cpp_func is not None:
         # Benchmark C++ implementation
         print("C++ Implementation:")
         cpp_result, cpp_time = benchmark_function(cpp_func, *args, iterations=iterations, name="C++")
         
         # Verify results match
-        if py_result == cpp_result:
+        if np.array_equal(py_result, cpp_result):
             print("✓ Results match!")
         else:
             print(f"✗ Results differ! Python: {py_result}, C++: {cpp_result}")
@@ -97,7 +202,11 @@ def compare_implementations(test_name: str, python_func: Callable, cpp_func: Cal
             print(f"\nPerformance Summary:")
             print(f"  Python time:  {py_time:.6f} seconds")
             print(f"  C++ time:     {cpp_time:.6f} seconds")
+            if nb_time is not None:
+                print(f"  Numba time:   {nb_time:.6f} seconds")
             print(f"  Speedup:      {speedup:.2f}x faster with C++")
+            if nb_time is not None:
+                print(f"  vs Numba:     {nb_time / cpp_time:.2f}x faster with C++")
             
             if speedup > 1:
                 improvement = ((speedup - 1) * 100)
@@ -112,6 +221,38 @@ def compare_implementations(test_name: str, python_func: Callable, cpp_func: Cal
         print(f"\nPython time: {py_time:.6f} seconds")
 
 
+def compare_variants(test_name: str, variants: list, args: tuple, iterations: int = 1) -> None:
+    """
+    Benchmark several implementations of the same computation side by side.
+    
+    Args:
+        test_name: Name of the test for display
+        variants: List of (label, function) pairs; entries whose function is
+            None (e.g. C++ without the extension built) are skipped
+        args: Arguments to pass to every function
+        iterations: Number of iterations for benchmarking
+    """
+    print(f"\n{test_name}")
+    print("=" * len(test_name))
+    
+    rows = []
+    for label, func in variants:
+        if func is not None:
+            result, elapsed = benchmark_function(func, *args, iterations=iterations, name=label)
+            rows.append((label, result, elapsed))
+    
+    reference = rows[0][1]
+    if all(np.array_equal(reference, result) for _, result, _ in rows):
+        print("✓ Results match!")
+    else:
+        print("✗ Results differ between implementations!")
+    
+    width = max(len(label) for label, _, _ in rows)
+    print(f"\nAlgorithmic Comparison:")
+    for label, _, elapsed in rows:
+        print(f"  {label:<{width}}  {elapsed:.9f} seconds")
+
+
 def run_all_benchmarks():
     """Run all performance benchmarks comparing Python and C++ implementations."""
     
@@ -129,6 +270,20 @@ def run_all_benchmarks():
         python_implementation.sum_of_squares,
         cpp_accelerated.sum_of_squares if CPP_AVAILABLE else None,
         (100000,),
+        iterations=5,
+        numba_func=python_implementation.sum_of_squares_nb
+    )
+    
+    # Test 1b: Closed form against the O(n) loops it replaces
+    compare_variants(
+        "1b. Sum of Squares: Closed Form vs Loop (n=10,000)",
+        [("Closed form (Python)", python_implementation.sum_of_squares_closed),
+         ("Chunked closed form (Python)", python_implementation.sum_of_squares_chunked),
+         ("Loop (NumPy)", python_implementation.sum_of_squares_numpy),
+         ("Loop (Python+Numba)", python_implementation.sum_of_squares_nb),
+         ("Loop (C++)", cpp_accelerated.sum_of_squares if CPP_AVAILABLE else None),
+         ("Closed form (C++)", cpp_accelerated.sum_of_squares_optimized if CPP_AVAILABLE else None)],
+        (10000,),
         iterations=5
     )
     
@@ -138,16 +293,75 @@ def run_all_benchmarks():
         python_implementation.fibonacci_recursive,
         cpp_accelerated.fibonacci_recursive if CPP_AVAILABLE else None,
         (35,),
-        iterations=1
+        iterations=1,
+        numba_func=python_implementation.fibonacci_nb
     )
     
+    # Fast doubling computes the same numbers in O(log n) steps, so it can be
+    # measured at a size the recursive versions could never reach
+    print("\n2b. Fibonacci Fast Doubling vs Memoized (Python)")
+    print("=" * 47)
+    
+    print("Memoized Python Implementation (n=35):")
+    rec_result, rec_time = benchmark_function(
+        python_implementation.fibonacci_recursive, 35, iterations=1, name="Memoized"
+    )
+    
+    print("Fast Doubling Python Implementation (n=35):")
+    fast_result, fast_time = benchmark_function(
+        python_implementation.fibonacci_fast, 35, iterations=5, name="Fast doubling"
+    )
+    
+    if rec_result == fast_result:
+        print("✓ Results match!")
+    else:
+        print(f"✗ Results differ! Memoized: {rec_result}, Fast doubling: {fast_result}")
+    
+    print("Iterative Numba Implementation (n=35):")
+    iter_result, iter_time = benchmark_function(
+        python_implementation.fibonacci_iter, 35, iterations=5, name="Iterative"
+    )
+    
+    if iter_result == fast_result:
+        print("✓ Results match!")
+    else:
+        print(f"✗ Results differ! Iterative: {iter_result}, Fast doubling: {fast_result}")
+    
+    print("Fast Doubling Python Implementation (n=1000):")
+    big_result, big_time = benchmark_function(
+        python_implementation.fibonacci_fast, 1000, iterations=5, name="Fast doubling"
+    )
+    print(f"  F(1000) has {len(str(big_result))} digits")
+    
     # Test 3: Prime Counting
     compare_implementations(
         "3. Prime Count (limit=10,000)",
         python_implementation.prime_count,
         cpp_accelerated.prime_count if CPP_AVAILABLE else None,
         (10000,),
-        iterations=3
+        iterations=3,
+        numba_func=python_implementation.prime_count_nb if python_implementation.NUMBA_AVAILABLE else None
+    )
+    
+    # Test 3b: Sieve against sieve, so the speedup reflects the implementation
+    # rather than the algorithm
+    compare_implementations(
+        "3b. Prime Count Sieve (limit=100,000)",
+        python_implementation.prime_count_sieve,
+        cpp_accelerated.prime_count_optimized if CPP_AVAILABLE else None,
+        (100000,),
+        iterations=3,
+        numba_func=python_implementation.prime_count_sieve_nb if python_implementation.NUMBA_AVAILABLE else None
+    )
+    
+    # Test 3c: Large enough for the Python sieve to switch to segments
+    compare_implementations(
+        "3c. Prime Count Segmented Sieve (limit=5,000,000)",
+        python_implementation.prime_count_sieve,
+        cpp_accelerated.prime_count_optimized if CPP_AVAILABLE else None,
+        (5000000,),
+        iterations=3,
+        numba_func=python_implementation.prime_count_sieve_nb if python_implementation.NUMBA_AVAILABLE else None
     )
     
     # Test 4: Matrix Multiplication
@@ -156,6 +370,30 @@ def run_all_benchmarks():
         python_implementation.matrix_multiplication,
         cpp_accelerated.matrix_multiplication if CPP_AVAILABLE else None,
         (100,),
+        iterations=3,
+        numba_func=python_implementation.matmul_nb
+    )
+    
+    # Test 4b: BLAS, naive, cache-blocked and flat vectorized compiled loops on the same matrices
+    compare_variants(
+        "4b. Matrix Multiplication Variants (200x200)",
+        [("NumPy @ (BLAS)", python_implementation.matrix_multiplication),
+         ("Numba naive", python_implementation.matmul_nb),
+         ("Numba tiled", python_implementation.matmul_numba_tiled),
+         ("Numba flat fastmath", python_implementation.matmul_flat),
+         ("C++", cpp_accelerated.matrix_multiplication if CPP_AVAILABLE else None),
+         ("C++ OpenMP", getattr(cpp_accelerated, "matrix_multiplication_parallel", None) if CPP_AVAILABLE else None)],
+        (200,),
+        iterations=3
+    )
+    
+    # Test 4c: Interpreted list-of-lists loops, at a size they finish quickly
+    compare_variants(
+        "4c. Pure-Python Matrix Multiplication (64x64)",
+        [("NumPy @ (BLAS)", python_implementation.matrix_multiplication),
+         ("Lists, i-k-j", python_implementation.matmul_lists),
+         ("Lists, blocked", python_implementation.matmul_lists_blocked)],
+        (64,),
         iterations=3
     )
     
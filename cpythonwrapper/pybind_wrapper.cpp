@@ -27,9 +27,10 @@ PYBIND11_MODULE(cpp_accelerated, m) {
           "Count the number of prime numbers up to the given limit (C++ implementation)",
           py::arg("limit"));
     
+    // Releases the GIL while multiplying so independent calls can run in threads
     m.def("matrix_multiplication", &cpp_functions::matrix_multiplication,
           "Perform matrix multiplication of two size x size matrices (C++ implementation)",
-          py::arg("size"));
+          py::arg("size"), py::call_guard<py::gil_scoped_release>());
     
     // Optimized versions that leverage C++ capabilities
     m.def("sum_of_squares_optimized", &cpp_functions::sum_of_squares_optimized,
@@ -44,6 +45,10 @@ PYBIND11_MODULE(cpp_accelerated, m) {
           "Calculate Fibonacci with memoization (C++ optimized)",
           py::arg("n"));
     
+    m.def("matrix_multiplication_parallel", &cpp_functions::matrix_multiplication_parallel,
+          "Perform matrix multiplication with OpenMP threads over the rows (C++ optimized)",
+          py::arg("size"), py::call_guard<py::gil_scoped_release>());
+    
     // Wrapper functions for easier benchmarking
     m.def("benchmark_sum_of_squares", [](int n, int iterations) {
         auto start = std::chrono::high_resolution_clock::now();
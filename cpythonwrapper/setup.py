@@ -3,11 +3,181 @@ Setup script for building the C++ accelerated Python extension.
 This script uses pybind11 to create a Python module from C++ code.
 """
 
+import glob
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+
 from setuptools import setup, Extension
+from setuptools.errors import CompileError, LinkError
 from pybind11.setup_helpers import Pybind11Extension, build_ext
 from pybind11 import get_cmake_dir
 import pybind11
 
+# Cython is optional: with it installed, fast_numeric.pyx is compiled too
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+# Optimization flags for the host compiler. Link-time optimization (-flto,
+# /GL + /LTCG) lets the kernels in cpp_functions.cpp be inlined into the
+# pybind11 wrappers in the other translation unit. -march=native tunes for
+# (and only runs on) the building machine's CPU; set
+# CPP_ACCELERATED_PORTABLE=1 to leave it out when building for other machines.
+# OpenMP flags for matrix_multiplication_parallel go in OPENMP_COMPILE_ARGS and
+# OPENMP_LINK_ARGS; the build drops them again if the compiler cannot build an
+# OpenMP program, and the pragmas then compile to a serial loop.
+portable = bool(os.environ.get("CPP_ACCELERATED_PORTABLE"))
+OPENMP_COMPILE_ARGS = []
+OPENMP_LINK_ARGS = []
+if sys.platform == "win32":
+    extra_compile_args = ["/O2", "/fp:fast", "/GL"]
+    if not portable and platform.machine().lower() in ("amd64", "x86_64"):
+        extra_compile_args.append("/arch:AVX2")
+    extra_link_args = ["/LTCG"]
+    OPENMP_COMPILE_ARGS = ["/openmp:llvm"]
+else:
+    extra_compile_args = ["-O3", "-ffast-math", "-funroll-loops", "-flto"]
+    if not portable:
+        extra_compile_args.append("-march=native")
+    extra_link_args = ["-flto"]
+    if sys.platform == "darwin":
+        # Build for the running interpreter's architecture only
+        arch_flags = ["-arch", platform.machine()]
+        extra_compile_args += arch_flags
+        extra_link_args += arch_flags
+        # Apple clang ships no OpenMP runtime; use Homebrew's libomp when it
+        # is installed, otherwise matrix_multiplication_parallel runs serially
+        for libomp in ("/opt/homebrew/opt/libomp", "/usr/local/opt/libomp"):
+            if os.path.isdir(libomp):
+                OPENMP_COMPILE_ARGS = ["-Xpreprocessor", "-fopenmp", f"-I{libomp}/include"]
+                OPENMP_LINK_ARGS = [f"-L{libomp}/lib", "-lomp"]
+                break
+    else:
+        OPENMP_COMPILE_ARGS = ["-fopenmp"]
+        OPENMP_LINK_ARGS = ["-fopenmp"]
+extra_compile_args += OPENMP_COMPILE_ARGS
+extra_link_args += OPENMP_LINK_ARGS
+
+# CPYTHONWRAPPER_DEBUG_INFO=1 keeps the release flags and adds debug info, so
+# profilers and debuggers can map samples in the optimized code to source.
+if os.environ.get("CPYTHONWRAPPER_DEBUG_INFO"):
+    if sys.platform == "win32":
+        extra_compile_args.append("/Zi")
+        extra_link_args.append("/DEBUG")
+    else:
+        extra_compile_args.append("-g")
+
+# Representative calls that train the profile-guided (CPYTHONWRAPPER_PGO=1) build
+PGO_TRAINING = """
+import cpp_accelerated as c
+for n in (1000, 100000, 1000000):
+    c.sum_of_squares(n)
+    c.sum_of_squares_optimized(n)
+for limit in (1000, 10000, 100000):
+    c.prime_count(limit)
+    c.prime_count_optimized(limit)
+for n in (20, 25, 30):
+    c.fibonacci_recursive(n)
+c.fibonacci_memoized(40)
+for size in (50, 100, 200):
+    c.matrix_multiplication(size)
+    c.matrix_multiplication_parallel(size)
+"""
+
+
+OPENMP_CHECK = """
+#include <omp.h>
+int main() { return omp_get_max_threads() > 0 ? 0 : 1; }
+"""
+
+
+class OptimizedBuildExt(build_ext):
+    """
+    build_ext that checks for OpenMP and can build cpp_accelerated with PGO.
+    
+    The OpenMP flags are kept only if the compiler can compile and link
+    OPENMP_CHECK with them, so a toolchain without an OpenMP runtime still
+    builds the extension, with matrix_multiplication_parallel running serially.
+    
+    With CPYTHONWRAPPER_PGO=1 on GCC or Clang the extension is built twice:
+    first instrumented, run once through PGO_TRAINING, then rebuilt with the
+    recorded profile so branch layout and inlining follow the real workload.
+    """
+    
+    def build_extensions(self):
+        if OPENMP_COMPILE_ARGS and not self._has_openmp():
+            print("OpenMP is not available; matrix_multiplication_parallel will run serially")
+            for ext in self.extensions:
+                ext.extra_compile_args = [arg for arg in ext.extra_compile_args
+                                          if arg not in OPENMP_COMPILE_ARGS]
+                ext.extra_link_args = [arg for arg in ext.extra_link_args
+                                       if arg not in OPENMP_LINK_ARGS]
+        super().build_extensions()
+    
+    def _has_openmp(self):
+        """Compile and link OPENMP_CHECK with the OpenMP flags."""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "openmp_check.cpp")
+            with open(source, "w") as f:
+                f.write(OPENMP_CHECK)
+            try:
+                objects = self.compiler.compile(
+                    [source], output_dir=tmp, extra_postargs=OPENMP_COMPILE_ARGS
+                )
+                self.compiler.link_executable(
+                    objects, "openmp_check", output_dir=tmp, extra_postargs=OPENMP_LINK_ARGS
+                )
+            except (CompileError, LinkError):
+                return False
+        return True
+    
+    def run(self):
+        if not os.environ.get("CPYTHONWRAPPER_PGO") or sys.platform == "win32":
+            super().run()
+            return
+        
+        extension = next(ext for ext in self.extensions if ext.name == "cpp_accelerated")
+        compile_args = list(extension.extra_compile_args)
+        link_args = list(extension.extra_link_args)
+        profile_dir = os.path.abspath(os.path.join(self.build_temp, "pgo"))
+        shutil.rmtree(profile_dir, ignore_errors=True)
+        
+        # Stage 1: instrumented build, exercised by the training calls
+        generate = [f"-fprofile-generate={profile_dir}"]
+        extension.extra_compile_args = compile_args + generate
+        extension.extra_link_args = link_args + generate
+        self.force = True
+        compiler_name = self.compiler
+        super().run()
+        
+        module_dir = os.path.dirname(os.path.abspath(self.get_ext_fullpath(extension.name)))
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [module_dir, env.get("PYTHONPATH")]))
+        subprocess.check_call([sys.executable, "-c", PGO_TRAINING], cwd=module_dir, env=env)
+        
+        # Stage 2: rebuild against the profile. run() replaced self.compiler
+        # with the compiler object, so restore the name before running again.
+        is_clang = "clang" in " ".join(self.compiler.compiler_so)
+        self.compiler = compiler_name
+        if is_clang:
+            # Clang writes raw profiles that have to be merged first
+            profile = os.path.join(profile_dir, "default.profdata")
+            merge = ["llvm-profdata"] if shutil.which("llvm-profdata") else ["xcrun", "llvm-profdata"]
+            subprocess.check_call(merge + ["merge", f"-output={profile}"]
+                                  + glob.glob(os.path.join(profile_dir, "*.profraw")))
+            use = [f"-fprofile-use={profile}"]
+        else:
+            use = [f"-fprofile-use={profile_dir}", "-fprofile-correction"]
+        extension.extra_compile_args = compile_args + use
+        extension.extra_link_args = link_args + use
+        super().run()
+
+
 # Define the extension module
 ext_modules = [
     Pybind11Extension(
@@ -22,13 +192,23 @@ ext_modules = [
         ],
         language='c++',
         cxx_std=14,  # C++14 standard
-        # Force correct architecture
         define_macros=[('VERSION_INFO', '"dev"')],
-        extra_compile_args=["-arch", "arm64"],
-        extra_link_args=["-arch", "arm64"],
+        extra_compile_args=extra_compile_args,
+        extra_link_args=extra_link_args,
     ),
 ]
 
+if cythonize is not None:
+    ext_modules += cythonize(
+        ["fast_numeric.pyx"],
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+            "cdivision": True,
+            "language_level": "3",
+        },
+    )
+
 setup(
     name="cpp_accelerated",
     version="1.0.0",
@@ -50,7 +230,7 @@ setup(
     implementations and C++ accelerated versions of the same algorithms.
     """,
     ext_modules=ext_modules,
-    cmdclass={"build_ext": build_ext},
+    cmdclass={"build_ext": OptimizedBuildExt},
     zip_safe=False,
     python_requires=">=3.6",
     install_requires=[